@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import asyncio
+import inspect
+from collections.abc import Awaitable, Sequence
 from typing import Any
 
 import httpx
@@ -8,7 +10,13 @@ import httpx
 from ._exceptions import WhatsAppAPIError, GraphAPIErrorBody
 from ._types import (
     Contact,
+    ContactAddress,
+    ContactEmail,
     ContactInfo,
+    ContactName,
+    ContactOrg,
+    ContactPhone,
+    ContactUrl,
     ListSection,
     MessageId,
     MessageResponse,
@@ -34,7 +42,11 @@ class WhatsAppClient:
         self._access_token = access_token
         self._base_url = base_url
         self._http = httpx.AsyncClient(
-            base_url=f"{base_url}/{phone_number_id}", headers={"Authorization": f"Bearer {access_token}"}
+            base_url=f"{base_url}/{phone_number_id}",
+            headers={"Authorization": f"Bearer {access_token}"},
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(10.0, connect=5.0),
         )
 
     async def __aenter__(self) -> WhatsAppClient:
@@ -93,10 +105,81 @@ class WhatsAppClient:
                     "parameters": [WhatsAppClient._serialize_parameter(p) for p in parameters],
                 }
 
+    @staticmethod
+    def _serialize_name(name: ContactName) -> dict[str, str]:
+        result: dict[str, str] = {"formatted_name": name.formatted_name}
+        if name.first_name is not None:
+            result["first_name"] = name.first_name
+        if name.last_name is not None:
+            result["last_name"] = name.last_name
+        if name.middle_name is not None:
+            result["middle_name"] = name.middle_name
+        if name.suffix is not None:
+            result["suffix"] = name.suffix
+        if name.prefix is not None:
+            result["prefix"] = name.prefix
+        return result
+
+    @staticmethod
+    def _serialize_phone(phone: ContactPhone) -> dict[str, str]:
+        result: dict[str, str] = {"phone": phone.phone, "type": phone.type}
+        if phone.wa_id is not None:
+            result["wa_id"] = phone.wa_id
+        return result
+
+    @staticmethod
+    def _serialize_email(email: ContactEmail) -> dict[str, str]:
+        return {"email": email.email, "type": email.type}
+
+    @staticmethod
+    def _serialize_address(address: ContactAddress) -> dict[str, str]:
+        result: dict[str, str] = {}
+        if address.street is not None:
+            result["street"] = address.street
+        if address.city is not None:
+            result["city"] = address.city
+        if address.state is not None:
+            result["state"] = address.state
+        if address.zip is not None:
+            result["zip"] = address.zip
+        if address.country is not None:
+            result["country"] = address.country
+        if address.country_code is not None:
+            result["country_code"] = address.country_code
+        result["type"] = address.type
+        return result
+
+    @staticmethod
+    def _serialize_url(url: ContactUrl) -> dict[str, str]:
+        return {"url": url.url, "type": url.type}
+
+    @staticmethod
+    def _serialize_org(org: ContactOrg) -> dict[str, str]:
+        result: dict[str, str] = {}
+        if org.company is not None:
+            result["company"] = org.company
+        if org.department is not None:
+            result["department"] = org.department
+        if org.title is not None:
+            result["title"] = org.title
+        return result
+
     @staticmethod
     def _serialize_contact(contact: ContactInfo) -> dict[str, Any]:
-        raw = asdict(contact)
-        return {k: v for k, v in raw.items() if v is not None}
+        result: dict[str, Any] = {"name": WhatsAppClient._serialize_name(contact.name)}
+        if contact.phones is not None:
+            result["phones"] = [WhatsAppClient._serialize_phone(p) for p in contact.phones]
+        if contact.emails is not None:
+            result["emails"] = [WhatsAppClient._serialize_email(e) for e in contact.emails]
+        if contact.addresses is not None:
+            result["addresses"] = [WhatsAppClient._serialize_address(a) for a in contact.addresses]
+        if contact.urls is not None:
+            result["urls"] = [WhatsAppClient._serialize_url(u) for u in contact.urls]
+        if contact.org is not None:
+            result["org"] = WhatsAppClient._serialize_org(contact.org)
+        if contact.birthday is not None:
+            result["birthday"] = contact.birthday
+        return result
 
     # --- Public send methods ---
 
@@ -195,3 +278,21 @@ class WhatsAppClient:
         if footer is not None:
             interactive["footer"] = {"text": footer}
         return await self._send({"to": to, "type": "interactive", "interactive": interactive})
+
+    # --- Batching ---
+
+    async def send_batch(
+        self, sends: Sequence[Awaitable[MessageResponse]], *, concurrency: int = 20
+    ) -> list[MessageResponse | BaseException]:
+        if concurrency < 1:
+            for send in sends:
+                if inspect.iscoroutine(send):
+                    send.close()
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(send: Awaitable[MessageResponse]) -> MessageResponse:
+            async with semaphore:
+                return await send
+
+        return await asyncio.gather(*(run(send) for send in sends), return_exceptions=True)
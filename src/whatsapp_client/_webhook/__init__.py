@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import json
@@ -32,19 +33,32 @@ from ._types import (
 class WebhookVerificationError(WhatsAppError): ...
 
 
+# Bodies above this size are hashed in a worker thread so the event loop is not blocked.
+_THREADED_VERIFY_THRESHOLD = 16 * 1024
+
 MessageCallback = Callable[[WhatsAppClient, WebhookNotification, Message], Awaitable[None]]
 StatusCallback = Callable[[WhatsAppClient, WebhookNotification, Status], Awaitable[None]]
 
 
-def verify_signature(*, body: bytes, signature: str, app_secret: str) -> None:
+def _verify_mac(mac: hmac.HMAC, body: bytes, signature: str) -> None:
     if not signature.startswith("sha256="):
         raise WebhookVerificationError("Invalid signature format: missing 'sha256=' prefix")
-    expected = hmac.new(app_secret.encode(), body, hashlib.sha256).hexdigest()
-    received = signature.removeprefix("sha256=")
-    if not hmac.compare_digest(expected, received):
+    hex_digest = signature.removeprefix("sha256=")
+    if len(hex_digest) != 2 * mac.digest_size:
+        raise WebhookVerificationError("Signature mismatch")
+    try:
+        received = bytes.fromhex(hex_digest)
+    except ValueError:
+        raise WebhookVerificationError("Signature mismatch") from None
+    mac.update(body)
+    if not hmac.compare_digest(mac.digest(), received):
         raise WebhookVerificationError("Signature mismatch")
 
 
+def verify_signature(*, body: bytes, signature: str, app_secret: str) -> None:
+    _verify_mac(hmac.new(app_secret.encode(), digestmod=hashlib.sha256), body, signature)
+
+
 def verify_challenge(*, mode: str, token: str, challenge: str, verify_token: str) -> str:
     if mode != "subscribe":
         raise WebhookVerificationError(f"Unexpected mode: {mode}")
@@ -61,11 +75,13 @@ class WebhookHandler:
         client: WhatsAppClient,
         on_message: MessageCallback | None = None,
         on_status: StatusCallback | None = None,
+        concurrent: bool = False,
     ) -> None:
-        self._app_secret = app_secret
+        self._mac = hmac.new(app_secret.encode(), digestmod=hashlib.sha256)
         self._client = client
         self._on_message = on_message
         self._on_status = on_status
+        self._concurrent = concurrent
 
     def on_message(self, func: MessageCallback) -> MessageCallback:
         self._on_message = func
@@ -76,9 +92,26 @@ class WebhookHandler:
         return func
 
     async def handle(self, *, body: bytes, signature: str) -> None:
-        verify_signature(body=body, signature=signature, app_secret=self._app_secret)
+        if len(body) > _THREADED_VERIFY_THRESHOLD:
+            await asyncio.to_thread(_verify_mac, self._mac.copy(), body, signature)
+        else:
+            _verify_mac(self._mac.copy(), body, signature)
+        if self._on_message is None and self._on_status is None:
+            return
         data: dict[str, Any] = json.loads(body)
         notifications = WebhookNotification.from_dict(data)
+        if self._concurrent:
+            callbacks: list[Awaitable[None]] = []
+            for notification in notifications:
+                if self._on_message is not None:
+                    callbacks.extend(self._on_message(self._client, notification, m) for m in notification.messages)
+                if self._on_status is not None:
+                    callbacks.extend(self._on_status(self._client, notification, s) for s in notification.statuses)
+            results = await asyncio.gather(*callbacks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return
         for notification in notifications:
             if self._on_message is not None:
                 for message in notification.messages:
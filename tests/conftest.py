@@ -12,7 +12,7 @@ def vcr_config():
     return {"filter_headers": ["authorization"], "match_on": ["method", "scheme", "host", "port", "body"]}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def whatsapp_client():
     phone_number_id = os.environ.get("WHATSAPP_PHONE_NUMBER_ID", "123456789")
     access_token = os.environ.get("WHATSAPP_ACCESS_TOKEN", "test-token")
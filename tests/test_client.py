@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from inline_snapshot import snapshot
 
 from whatsapp_client import (
     Contact,
+    ContactAddress,
+    ContactEmail,
+    ContactInfo,
+    ContactName,
+    ContactOrg,
+    ContactPhone,
+    ContactUrl,
     ListRow,
     ListSection,
     MessageId,
@@ -30,73 +39,56 @@ async def test_send_text(whatsapp_client: WhatsAppClient) -> None:
     )
 
 
-async def test_send_image(whatsapp_client: WhatsAppClient) -> None:
-    response = await whatsapp_client.send_image(
-        to="33788813966",
-        link="https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/PNG_transparency_demonstration_1.png/280px-PNG_transparency_demonstration_1.png",
-        caption="Check this out",
-    )
-    assert response == snapshot(
-        MessageResponse(
-            messaging_product="whatsapp",
-            contacts=[Contact(input="33788813966", wa_id="33788813966")],
-            messages=[MessageId(id="wamid.HBgLMzM3ODg4MTM5NjYVAgARGBI0MUU5Q0JFNjE0MUUxOTkzOEUA")],
-        )
-    )
-
-
-async def test_send_audio(whatsapp_client: WhatsAppClient) -> None:
-    response = await whatsapp_client.send_audio(
-        to="33788813966", link="https://www.soundhelix.com/examples/mp3/SoundHelix-Song-1.mp3"
-    )
-    assert response == snapshot(
-        MessageResponse(
-            messaging_product="whatsapp",
-            contacts=[Contact(input="33788813966", wa_id="33788813966")],
-            messages=[MessageId(id="wamid.HBgLMzM3ODg4MTM5NjYVAgARGBIzOUU2QTQ0MUIxQ0U5OUFFMjAA")],
-        )
-    )
-
-
-async def test_send_video(whatsapp_client: WhatsAppClient) -> None:
-    response = await whatsapp_client.send_video(
-        to="33788813966",
-        link="https://sample-videos.com/video321/mp4/720/big_buck_bunny_720p_1mb.mp4",
-        caption="Watch this",
-    )
-    assert response == snapshot(
-        MessageResponse(
-            messaging_product="whatsapp",
-            contacts=[Contact(input="33788813966", wa_id="33788813966")],
-            messages=[MessageId(id="wamid.HBgLMzM3ODg4MTM5NjYVAgARGBI1Nzg2NzYxNzk2NTAwMTRFNDgA")],
-        )
-    )
-
-
-async def test_send_document(whatsapp_client: WhatsAppClient) -> None:
-    response = await whatsapp_client.send_document(
-        to="33788813966",
-        link="https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
-        caption="Important doc",
-        filename="report.pdf",
-    )
-    assert response == snapshot(
-        MessageResponse(
-            messaging_product="whatsapp",
-            contacts=[Contact(input="33788813966", wa_id="33788813966")],
-            messages=[MessageId(id="wamid.HBgLMzM3ODg4MTM5NjYVAgARGBI4NzUxOEE3NDY3Qzc1Qzg3NUQA")],
-        )
-    )
-
-
-async def test_send_sticker(whatsapp_client: WhatsAppClient) -> None:
-    response = await whatsapp_client.send_sticker(to="33788813966", link="https://www.gstatic.com/webp/gallery/1.webp")
-    assert response == snapshot(
-        MessageResponse(
-            messaging_product="whatsapp",
-            contacts=[Contact(input="33788813966", wa_id="33788813966")],
-            messages=[MessageId(id="wamid.HBgLMzM3ODg4MTM5NjYVAgARGBJGODg5NDg0QUQ4QjY1Mzg3QjEA")],
-        )
+@pytest.mark.parametrize(
+    ("method", "kwargs", "message_id"),
+    [
+        pytest.param(
+            "send_image",
+            {
+                "link": "https://upload.wikimedia.org/wikipedia/commons/thumb/4/47/PNG_transparency_demonstration_1.png/280px-PNG_transparency_demonstration_1.png",
+                "caption": "Check this out",
+            },
+            snapshot("wamid.HBgLMzM3ODg4MTM5NjYVAgARGBI0MUU5Q0JFNjE0MUUxOTkzOEUA"),
+            id="image",
+        ),
+        pytest.param(
+            "send_audio",
+            {"link": "https://www.soundhelix.com/examples/mp3/SoundHelix-Song-1.mp3"},
+            snapshot("wamid.HBgLMzM3ODg4MTM5NjYVAgARGBIzOUU2QTQ0MUIxQ0U5OUFFMjAA"),
+            id="audio",
+        ),
+        pytest.param(
+            "send_video",
+            {"link": "https://sample-videos.com/video321/mp4/720/big_buck_bunny_720p_1mb.mp4", "caption": "Watch this"},
+            snapshot("wamid.HBgLMzM3ODg4MTM5NjYVAgARGBI1Nzg2NzYxNzk2NTAwMTRFNDgA"),
+            id="video",
+        ),
+        pytest.param(
+            "send_document",
+            {
+                "link": "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
+                "caption": "Important doc",
+                "filename": "report.pdf",
+            },
+            snapshot("wamid.HBgLMzM3ODg4MTM5NjYVAgARGBI4NzUxOEE3NDY3Qzc1Qzg3NUQA"),
+            id="document",
+        ),
+        pytest.param(
+            "send_sticker",
+            {"link": "https://www.gstatic.com/webp/gallery/1.webp"},
+            snapshot("wamid.HBgLMzM3ODg4MTM5NjYVAgARGBJGODg5NDg0QUQ4QjY1Mzg3QjEA"),
+            id="sticker",
+        ),
+    ],
+)
+async def test_send_media(
+    whatsapp_client: WhatsAppClient, method: str, kwargs: dict[str, str], message_id: str
+) -> None:
+    response = await getattr(whatsapp_client, method)(to="33788813966", **kwargs)
+    assert response == MessageResponse(
+        messaging_product="whatsapp",
+        contacts=[Contact(input="33788813966", wa_id="33788813966")],
+        messages=[MessageId(id=message_id)],
     )
 
 
@@ -169,6 +161,39 @@ async def test_send_list(whatsapp_client: WhatsAppClient) -> None:
     )
 
 
+def test_serialize_contact_full() -> None:
+    contact = ContactInfo(
+        name=ContactName(formatted_name="John Doe", first_name="John", last_name="Doe", prefix="Dr."),
+        phones=[ContactPhone(phone="+5511999999999", wa_id="5511999999999"), ContactPhone(phone="+5511888888888")],
+        emails=[ContactEmail(email="john@example.com")],
+        addresses=[ContactAddress(street="Av. Paulista, 1000", city="São Paulo", country_code="BR")],
+        urls=[ContactUrl(url="https://example.com", type="HOME")],
+        org=ContactOrg(company="Acme", title="Engineer"),
+        birthday="1990-01-31",
+    )
+    assert WhatsAppClient._serialize_contact(contact) == snapshot(  # pyright: ignore[reportPrivateUsage]
+        {
+            "name": {"formatted_name": "John Doe", "first_name": "John", "last_name": "Doe", "prefix": "Dr."},
+            "phones": [
+                {"phone": "+5511999999999", "type": "CELL", "wa_id": "5511999999999"},
+                {"phone": "+5511888888888", "type": "CELL"},
+            ],
+            "emails": [{"email": "john@example.com", "type": "WORK"}],
+            "addresses": [{"street": "Av. Paulista, 1000", "city": "São Paulo", "country_code": "BR", "type": "HOME"}],
+            "urls": [{"url": "https://example.com", "type": "HOME"}],
+            "org": {"company": "Acme", "title": "Engineer"},
+            "birthday": "1990-01-31",
+        }
+    )
+
+
+def test_serialize_contact_minimal() -> None:
+    contact = ContactInfo(name=ContactName(formatted_name="John Doe"), phones=[])
+    assert WhatsAppClient._serialize_contact(contact) == snapshot(  # pyright: ignore[reportPrivateUsage]
+        {"name": {"formatted_name": "John Doe"}, "phones": []}
+    )
+
+
 async def test_invalid_token() -> None:
     async with WhatsAppClient(phone_number_id="123456789", access_token="invalid-token") as client:
         with pytest.raises(WhatsAppAPIError) as exc_info:
@@ -186,3 +211,55 @@ async def test_invalid_phone(whatsapp_client: WhatsAppClient) -> None:
     error = exc_info.value
     assert error.status_code == snapshot(400)
     assert error.error_code == snapshot(131030)
+
+
+def _fake_response(index: int) -> MessageResponse:
+    return MessageResponse(messaging_product="whatsapp", contacts=[], messages=[MessageId(id=f"wamid.{index}")])
+
+
+async def test_send_batch(whatsapp_client: WhatsAppClient) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_send(index: int) -> MessageResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return _fake_response(index)
+
+    responses = await whatsapp_client.send_batch([fake_send(i) for i in range(5)], concurrency=2)
+    assert responses == [_fake_response(i) for i in range(5)]
+    assert max_in_flight == 2
+
+
+async def test_send_batch_prebuilt_list(whatsapp_client: WhatsAppClient) -> None:
+    async def fake_send(index: int) -> MessageResponse:
+        return _fake_response(index)
+
+    sends = [fake_send(i) for i in range(3)]
+    responses = await whatsapp_client.send_batch(sends)
+    assert responses == [_fake_response(i) for i in range(3)]
+
+
+async def test_send_batch_partial_failure(whatsapp_client: WhatsAppClient) -> None:
+    error = WhatsAppAPIError(status_code=400, error_code=131030, error_type="OAuthException", message="Invalid")
+
+    async def fake_send(index: int) -> MessageResponse:
+        await asyncio.sleep(0)
+        if index == 0:
+            raise error
+        return _fake_response(index)
+
+    responses = await whatsapp_client.send_batch([fake_send(i) for i in range(5)], concurrency=2)
+    assert responses == [error, *(_fake_response(i) for i in range(1, 5))]
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_send_batch_invalid_concurrency(whatsapp_client: WhatsAppClient, concurrency: int) -> None:
+    async def fake_send() -> MessageResponse:
+        return _fake_response(0)
+
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        await whatsapp_client.send_batch([fake_send()], concurrency=concurrency)
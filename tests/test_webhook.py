@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import json
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -49,6 +50,24 @@ def _wrap_payload(value: dict[str, Any]) -> dict[str, Any]:
 
 METADATA = {"display_phone_number": "15550001111", "phone_number_id": "123456"}
 
+TEXT_MESSAGE_BODY = json.dumps(
+    _wrap_payload(
+        {
+            "metadata": METADATA,
+            "messages": [
+                {
+                    "id": "wamid.1",
+                    "from": "5511999999999",
+                    "timestamp": "1700000000",
+                    "type": "text",
+                    "text": {"body": "Hi"},
+                }
+            ],
+        }
+    )
+).encode()
+TEXT_MESSAGE_SIG = _sign(TEXT_MESSAGE_BODY)
+
 
 # --- Signature verification ---
 
@@ -62,6 +81,23 @@ class TestVerifySignature:
         with pytest.raises(WebhookVerificationError, match="Signature mismatch"):
             verify_signature(body=b"body", signature="sha256=bad", app_secret=APP_SECRET)
 
+    def test_truncated_signature(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        update = Mock()
+        monkeypatch.setattr(hmac.HMAC, "update", update)
+        with pytest.raises(WebhookVerificationError, match="Signature mismatch"):
+            verify_signature(body=b"body", signature=_sign(b"body")[:-2], app_secret=APP_SECRET)
+        update.assert_not_called()
+
+    def test_whitespace_separated_signature(self) -> None:
+        hex_digest = _sign(b"body").removeprefix("sha256=")
+        spaced = " ".join(hex_digest[i : i + 2] for i in range(0, len(hex_digest), 2))
+        with pytest.raises(WebhookVerificationError, match="Signature mismatch"):
+            verify_signature(body=b"body", signature=f"sha256={spaced}", app_secret=APP_SECRET)
+
+    def test_signature_for_other_body(self) -> None:
+        with pytest.raises(WebhookVerificationError, match="Signature mismatch"):
+            verify_signature(body=b"body", signature=_sign(b"other"), app_secret=APP_SECRET)
+
     def test_bad_format(self) -> None:
         with pytest.raises(WebhookVerificationError, match="missing 'sha256=' prefix"):
             verify_signature(body=b"body", signature="invalid", app_secret=APP_SECRET)
@@ -407,22 +443,7 @@ class TestWebhookHandler:
     async def test_on_message_dispatch(self, client: WhatsAppClient) -> None:
         on_message = AsyncMock()
         handler = self._make_handler(client, on_message=on_message)
-        payload = _wrap_payload(
-            {
-                "metadata": METADATA,
-                "messages": [
-                    {
-                        "id": "wamid.1",
-                        "from": "5511999999999",
-                        "timestamp": "1700000000",
-                        "type": "text",
-                        "text": {"body": "Hi"},
-                    }
-                ],
-            }
-        )
-        body, sig = self._signed_body(payload)
-        await handler.handle(body=body, signature=sig)
+        await handler.handle(body=TEXT_MESSAGE_BODY, signature=TEXT_MESSAGE_SIG)
         on_message.assert_awaited_once()
         assert on_message.await_args is not None
         _, notification, message = on_message.await_args.args
@@ -454,6 +475,24 @@ class TestWebhookHandler:
 
     async def test_no_handler_registered(self, client: WhatsAppClient) -> None:
         handler = self._make_handler(client)
+        await handler.handle(body=TEXT_MESSAGE_BODY, signature=TEXT_MESSAGE_SIG)  # should not raise
+
+    async def test_no_handler_skips_parsing(self, client: WhatsAppClient) -> None:
+        handler = self._make_handler(client)
+        body = b"not json"
+        await handler.handle(body=body, signature=_sign(body))  # verified, never decoded
+
+    async def test_signature_rejection(self, client: WhatsAppClient) -> None:
+        handler = self._make_handler(client)
+        with pytest.raises(WebhookVerificationError):
+            await handler.handle(body=b"body", signature="sha256=bad")
+
+    async def test_large_body(self, client: WhatsAppClient, monkeypatch: pytest.MonkeyPatch) -> None:
+        to_thread = Mock(wraps=asyncio.to_thread)
+        monkeypatch.setattr("whatsapp_client._webhook.asyncio.to_thread", to_thread)
+        on_message = AsyncMock()
+        handler = self._make_handler(client, on_message=on_message)
+        text = "x" * 32 * 1024
         payload = _wrap_payload(
             {
                 "metadata": METADATA,
@@ -463,68 +502,116 @@ class TestWebhookHandler:
                         "from": "5511999999999",
                         "timestamp": "1700000000",
                         "type": "text",
-                        "text": {"body": "Hi"},
+                        "text": {"body": text},
                     }
                 ],
             }
         )
         body, sig = self._signed_body(payload)
-        await handler.handle(body=body, signature=sig)  # should not raise
-
-    async def test_signature_rejection(self, client: WhatsAppClient) -> None:
-        handler = self._make_handler(client)
-        with pytest.raises(WebhookVerificationError):
-            await handler.handle(body=b"body", signature="sha256=bad")
-
-    async def test_decorator_overrides_constructor(self, client: WhatsAppClient) -> None:
-        constructor_cb = AsyncMock()
-        decorator_cb = AsyncMock()
-        handler = self._make_handler(client, on_message=constructor_cb)
-
-        @handler.on_message
-        async def handle_message(c: WhatsAppClient, n: WebhookNotification, m: Message) -> None:
-            await decorator_cb(c, n, m)
-
-        _ = handle_message  # registered via decorator
+        await handler.handle(body=body, signature=sig)
+        to_thread.assert_called_once()
+        assert on_message.await_args is not None
+        assert on_message.await_args.args[2].content == TextContent(body=text)
+        to_thread.reset_mock()
+        await handler.handle(body=TEXT_MESSAGE_BODY, signature=TEXT_MESSAGE_SIG)
+        to_thread.assert_not_called()
+        with pytest.raises(WebhookVerificationError, match="Signature mismatch"):
+            await handler.handle(body=body + b" ", signature=sig)
 
+    async def test_repeated_handle_calls(self, client: WhatsAppClient) -> None:
+        on_status = AsyncMock()
+        handler = self._make_handler(client, on_status=on_status)
+        for status in ("sent", "delivered"):
+            payload = _wrap_payload(
+                {
+                    "metadata": METADATA,
+                    "statuses": [
+                        {"id": "wamid.s1", "status": status, "timestamp": "1700000000", "recipient_id": "5511999999999"}
+                    ],
+                }
+            )
+            body, sig = self._signed_body(payload)
+            await handler.handle(body=body, signature=sig)
+        assert on_status.await_count == 2
+
+    async def test_concurrent_dispatch(self, client: WhatsAppClient) -> None:
+        second_started = asyncio.Event()
+
+        async def on_message(c: WhatsAppClient, n: WebhookNotification, m: Message) -> None:
+            if m.id == "wamid.1":
+                await second_started.wait()
+            else:
+                second_started.set()
+
+        handler = self._make_handler(client, on_message=on_message, concurrent=True)
         payload = _wrap_payload(
             {
                 "metadata": METADATA,
                 "messages": [
                     {
-                        "id": "wamid.1",
+                        "id": f"wamid.{i}",
                         "from": "5511999999999",
                         "timestamp": "1700000000",
                         "type": "text",
                         "text": {"body": "Hi"},
                     }
+                    for i in (1, 2)
                 ],
             }
         )
         body, sig = self._signed_body(payload)
-        await handler.handle(body=body, signature=sig)
-        constructor_cb.assert_not_awaited()
-        decorator_cb.assert_awaited_once()
+        await asyncio.wait_for(handler.handle(body=body, signature=sig), timeout=1)
 
-    async def test_client_passed_to_callback(self, client: WhatsAppClient) -> None:
-        on_message = AsyncMock()
-        handler = self._make_handler(client, on_message=on_message)
+    async def test_concurrent_dispatch_waits_for_all_callbacks(self, client: WhatsAppClient) -> None:
+        finished: list[str] = []
+
+        async def on_message(c: WhatsAppClient, n: WebhookNotification, m: Message) -> None:
+            if m.id == "wamid.1":
+                raise RuntimeError("callback failed")
+            for _ in range(3):
+                await asyncio.sleep(0)
+            finished.append(m.id)
+
+        handler = self._make_handler(client, on_message=on_message, concurrent=True)
         payload = _wrap_payload(
             {
                 "metadata": METADATA,
                 "messages": [
                     {
-                        "id": "wamid.1",
+                        "id": f"wamid.{i}",
                         "from": "5511999999999",
                         "timestamp": "1700000000",
                         "type": "text",
                         "text": {"body": "Hi"},
                     }
+                    for i in (1, 2)
                 ],
             }
         )
         body, sig = self._signed_body(payload)
-        await handler.handle(body=body, signature=sig)
+        with pytest.raises(RuntimeError, match="callback failed"):
+            await handler.handle(body=body, signature=sig)
+        assert finished == ["wamid.2"]
+
+    async def test_decorator_overrides_constructor(self, client: WhatsAppClient) -> None:
+        constructor_cb = AsyncMock()
+        decorator_cb = AsyncMock()
+        handler = self._make_handler(client, on_message=constructor_cb)
+
+        @handler.on_message
+        async def handle_message(c: WhatsAppClient, n: WebhookNotification, m: Message) -> None:
+            await decorator_cb(c, n, m)
+
+        _ = handle_message  # registered via decorator
+
+        await handler.handle(body=TEXT_MESSAGE_BODY, signature=TEXT_MESSAGE_SIG)
+        constructor_cb.assert_not_awaited()
+        decorator_cb.assert_awaited_once()
+
+    async def test_client_passed_to_callback(self, client: WhatsAppClient) -> None:
+        on_message = AsyncMock()
+        handler = self._make_handler(client, on_message=on_message)
+        await handler.handle(body=TEXT_MESSAGE_BODY, signature=TEXT_MESSAGE_SIG)
         assert on_message.await_args is not None
         passed_client = on_message.await_args.args[0]
         assert passed_client is client